@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 
+import io
 import os
 import re
 import sys
 import json
+import time
 import uuid
+import atexit
+import threading
+import functools
 import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, Iterable, Iterator, Callable
+
+try:
+    import orjson  # optional: faster sessions.json encode/decode
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # Paths
@@ -53,15 +65,26 @@ class C:
     BRIGHT_CYAN = "\033[96m"
     BRIGHT_WHITE = "\033[97m"
 
+# escapes are only written to a terminal
+_USE_COLOR = sys.stdout.isatty()
+
+@functools.lru_cache(maxsize=256)
 def color(text: str, *styles: str) -> str:
+    if not _USE_COLOR:
+        return text
     return "".join(styles) + text + C.RESET
 
+# fixed prompt/error strings reused by every input loop
+_PROMPT_CYAN = color("> ", C.BRIGHT_CYAN)
+_ERR_INT = color("Please enter a valid integer.", C.BRIGHT_RED)
+
 # =============================================================================
 # Utilities
 # =============================================================================
 
-def banner() -> None:
-    print(color(r"""
+# the banner is static, so it is colored once at import and written in one call
+_BANNER_STR = "\n".join([
+    color(r"""
                                                                                 
                                ...',;;::::;;,'...                               
                          .,coxO0XNWWMMMMMMMMWWNXKOxoc,.                         
@@ -95,44 +118,119 @@ def banner() -> None:
                                                        
                                                        
                                                                                  
-""".rstrip("\n"), C.BRIGHT_WHITE))
-    print(color("Welcome to PassWeaver (pwv) tool", C.BRIGHT_CYAN))
-    print(color("Create strong, personalized passwords from names, dates, and more!", C.BRIGHT_CYAN))
-    print(color("=" * 60, C.BRIGHT_GREEN))
+""".rstrip("\n"), C.BRIGHT_WHITE),
+    color("Welcome to PassWeaver (pwv) tool", C.BRIGHT_CYAN),
+    color("Create strong, personalized passwords from names, dates, and more!", C.BRIGHT_CYAN),
+    color("=" * 60, C.BRIGHT_GREEN),
+]) + "\n\n"
 
-    print()
+def banner() -> None:
+    # nothing to draw when output is piped or redirected
+    if not sys.stdout.isatty():
+        return
+    sys.stdout.write(_BANNER_STR)
+    sys.stdout.flush()
 
 def prompt(msg: str, default: Optional[str] = None, show_default_hint: bool = False) -> str:
 
     if show_default_hint and default not in (None, ""):
         msg = f"{msg} [{default}]"
     print(color(msg, C.BRIGHT_GREEN))
-    val = input(color("> ", C.BRIGHT_CYAN)).strip()
+    val = input(_PROMPT_CYAN).strip()
     return val if val else (default if default is not None else "")
 
+def _parse_int(s: str, default: Optional[int] = None) -> Optional[int]:
+    # isdecimal() pre-check (optional sign) instead of catching int()'s ValueError
+    s = s.strip()
+    digits = s[1:] if s[:1] in ("-", "+") else s
+    if digits.isdecimal():
+        return int(s)
+    return default
+
 def yes_no_prompt(msg: str, default_no: bool = True) -> bool:
     default = "y/N" if default_no else "Y/n"
     print(color(f"{msg}? ({default})", C.BRIGHT_GREEN))
-    val = input(color("> ", C.BRIGHT_CYAN)).strip().lower()
+    val = input(_PROMPT_CYAN).strip().lower()
     if val == "":
         return not default_no
     return val in {"y", "yes"}
 
+# parsed sessions.json, reused while the file's (mtime, size) stamp is unchanged;
+# "dirty" marks in-memory changes that have not been flushed to disk yet
+_SESSIONS_CACHE: Dict = {"stamp": None, "data": None, "dirty": False, "timer": None}
+_SESSIONS_LOCK = threading.Lock()
+SESSIONS_FLUSH_DELAY = 0.5  # seconds of quiet before pending session changes are written
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 def load_sessions() -> List[Dict]:
-    if not os.path.exists(SESSIONS_PATH):
+    if _SESSIONS_CACHE["dirty"]:
+        return _SESSIONS_CACHE["data"]
+    stamp = _file_stamp(SESSIONS_PATH)
+    if stamp is None:
         return []
+    if _SESSIONS_CACHE["stamp"] == stamp:
+        return _SESSIONS_CACHE["data"]
     try:
-        with open(SESSIONS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return data
-        return []
+        with open(SESSIONS_PATH, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return []
+    if not isinstance(data, list):
+        return []
+    _SESSIONS_CACHE["stamp"] = stamp
+    _SESSIONS_CACHE["data"] = data
+    return data
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+def encode_sessions(sessions: List[Dict]) -> bytes:
+    # one compact record per line: the stdlib only uses its C encoder without indent,
+    # and the file still reads (and diffs) a session at a time
+    if orjson is not None:
+        records = [orjson.dumps(s) for s in sessions]
+    else:
+        records = [_JSON_ENCODER.encode(s).encode("utf-8") for s in sessions]
+    return b"[\n" + b",\n".join(records) + b"\n]\n"
 
 def save_sessions(sessions: List[Dict]) -> None:
-    with open(SESSIONS_PATH, "w", encoding="utf-8") as f:
-        json.dump(sessions, f, ensure_ascii=False, indent=2)
+    payload = encode_sessions(sessions)
+    temp_path = SESSIONS_PATH + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(payload)
+    os.replace(temp_path, SESSIONS_PATH)
+    _SESSIONS_CACHE["stamp"] = _file_stamp(SESSIONS_PATH)
+    _SESSIONS_CACHE["data"] = sessions
+
+def schedule_sessions_flush(sessions: List[Dict]) -> None:
+    # coalesce bursts of updates into one write after SESSIONS_FLUSH_DELAY
+    with _SESSIONS_LOCK:
+        _SESSIONS_CACHE["data"] = sessions
+        _SESSIONS_CACHE["dirty"] = True
+        if _SESSIONS_CACHE["timer"] is not None:
+            _SESSIONS_CACHE["timer"].cancel()
+        timer = threading.Timer(SESSIONS_FLUSH_DELAY, flush_sessions)
+        timer.daemon = True
+        _SESSIONS_CACHE["timer"] = timer
+        timer.start()
+
+def flush_sessions() -> None:
+    with _SESSIONS_LOCK:
+        if _SESSIONS_CACHE["timer"] is not None:
+            _SESSIONS_CACHE["timer"].cancel()
+            _SESSIONS_CACHE["timer"] = None
+        if not _SESSIONS_CACHE["dirty"]:
+            return
+        save_sessions(_SESSIONS_CACHE["data"])
+        _SESSIONS_CACHE["dirty"] = False
+
+atexit.register(flush_sessions)
 
 def generate_session_id() -> str:
     return uuid.uuid4().hex[:12]
@@ -145,45 +243,79 @@ def now_iso() -> str:
 # Generator helpers
 # =============================================================================
 
+_STRING_IDX_RE = re.compile(r'string(\d*):u:')
+_CHAR_IDX_RE = re.compile(r'character(\d*):u:')
+
+_LEET_MAPPING = {
+    'a': ['a', '@'],
+    'e': ['e', '3'],
+    'i': ['i', '1'],
+    'o': ['o', '0'],
+    's': ['s', '$', '5'],
+    't': ['t', '7']
+}
+
+# per-character option table, upper-case mirror included, built once at import
+_LEET_OPTIONS: Dict[str, Tuple[str, ...]] = {}
+for _ch, _opts in _LEET_MAPPING.items():
+    _LEET_OPTIONS[_ch] = tuple(_opts)
+    _LEET_OPTIONS[_ch.upper()] = tuple(opt.upper() for opt in _opts)
+
 def generate_leet_variants(word: str) -> List[str]:
-    leet_mapping = {
-        'a': ['a', '@'],
-        'e': ['e', '3'],
-        'i': ['i', '1'],
-        'o': ['o', '0'],
-        's': ['s', '$', '5'],
-        't': ['t', '7']
-    }
-    char_options = []
-    for ch in word:
-        options = leet_mapping.get(ch.lower(), [ch])
-        if ch.isupper():
-            options = [opt.upper() for opt in options]
-        char_options.append(options)
-    variants = ["".join(candidate) for candidate in itertools.product(*char_options)]
-    return variants
-
-def apply_case_pattern(case_pattern: str, replacement: str) -> str:
+    get_options = _LEET_OPTIONS.get
+    char_options = [get_options(ch) or (ch,) for ch in word]
+    return list(map("".join, itertools.product(*char_options)))
+
+# (kind, zero-based positions to upper-case, upper-case last char);
+# kind is "A" (all upper), "N" (all lower), "MASK" (positions) or "KEEP"
+CaseSpec = Tuple[str, Tuple[int, ...], bool]
+
+@functools.lru_cache(maxsize=256)
+def parse_case_pattern(case_pattern: str) -> CaseSpec:
     if not case_pattern.startswith("u:"):
-        return replacement
+        return "KEEP", (), False
     pattern = case_pattern[2:]
     if pattern == "A":
-        return replacement.upper()
+        return "A", (), False
     if pattern == "N":
-        return replacement.lower()
-    result = list(replacement.lower())
-    positions = pattern.split(",")
-    for pos in positions:
+        return "N", (), False
+    upper_positions = []
+    upper_last = False
+    for pos in pattern.split(","):
         if pos == "L":
-            if result:
-                result[-1] = result[-1].upper()
+            upper_last = True
         else:
             try:
-                idx = int(pos) - 1
-                if 0 <= idx < len(result):
-                    result[idx] = result[idx].upper()
+                upper_positions.append(int(pos) - 1)
             except ValueError:
                 pass
+    return "MASK", tuple(upper_positions), upper_last
+
+@functools.lru_cache(maxsize=8192)
+def apply_case_pattern(case: CaseSpec, replacement: str) -> str:
+    kind, upper_positions, upper_last = case
+    if kind == "KEEP":
+        return replacement
+    if kind == "A":
+        return replacement.upper()
+    if kind == "N":
+        return replacement.lower()
+    lowered = replacement.lower()
+    if lowered.isascii():
+        # one contiguous buffer; only a-z (97-122) change when upper-cased
+        buf = bytearray(lowered, "ascii")
+        for idx in upper_positions:
+            if 0 <= idx < len(buf) and 97 <= buf[idx] <= 122:
+                buf[idx] -= 32
+        if upper_last and buf and 97 <= buf[-1] <= 122:
+            buf[-1] -= 32
+        return buf.decode("ascii")
+    result = list(lowered)
+    for idx in upper_positions:
+        if 0 <= idx < len(result):
+            result[idx] = result[idx].upper()
+    if upper_last and result:
+        result[-1] = result[-1].upper()
     return ''.join(result)
 
 def parse_date(date_str: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
@@ -223,7 +355,9 @@ def generate_numbers_from_date(date_str: str) -> List[str]:
     except Exception:
         return []
 
-def parse_rule(rule_str: str) -> List[Dict]:
+@functools.lru_cache(maxsize=4096)
+def parse_rule(rule_str: str) -> Tuple[Dict, ...]:
+    # cached: the returned tokens are shared between callers and must not be mutated
     tokens = rule_str.split(" + ")
     rule = []
     for token in tokens:
@@ -237,16 +371,18 @@ def parse_rule(rule_str: str) -> List[Dict]:
             rule.append({
                 "type": token_type,
                 "case_pattern": case_pattern,
+                "case": parse_case_pattern(case_pattern),
                 "index": 1
             })
         elif token.startswith("string") and ":u:" in token:
-            match = re.match(r'string(\d*):u:', token)
+            match = _STRING_IDX_RE.match(token)
             if match:
                 string_idx = int(match.group(1)) if match.group(1) else 1
                 case_pattern = "u:" + token.split(":u:")[1]
                 rule.append({
                     "type": "string",
                     "case_pattern": case_pattern,
+                    "case": parse_case_pattern(case_pattern),
                     "index": string_idx
                 })
             else:
@@ -254,16 +390,18 @@ def parse_rule(rule_str: str) -> List[Dict]:
                 rule.append({
                     "type": "string",
                     "case_pattern": "u:" + parts[2],
+                    "case": parse_case_pattern("u:" + parts[2]),
                     "index": 1
                 })
         elif token.startswith("character") and ":u:" in token:
-            match = re.match(r'character(\d*):u:', token)
+            match = _CHAR_IDX_RE.match(token)
             if match:
                 char_idx = int(match.group(1)) if match.group(1) else 1
                 case_pattern = "u:" + token.split(":u:")[1]
                 rule.append({
                     "type": "character",
                     "case_pattern": case_pattern,
+                    "case": parse_case_pattern(case_pattern),
                     "index": char_idx
                 })
             else:
@@ -271,6 +409,7 @@ def parse_rule(rule_str: str) -> List[Dict]:
                 rule.append({
                     "type": "character",
                     "case_pattern": "u:" + parts[2],
+                    "case": parse_case_pattern("u:" + parts[2]),
                     "index": 1
                 })
         elif token == "day":
@@ -294,204 +433,147 @@ def parse_rule(rule_str: str) -> List[Dict]:
             rule.append({"type": "literal", "value": value})
         else:
             rule.append({"type": "literal", "value": token})
-    return rule
+    return tuple(rule)
+
+DATE_TOKEN_TYPES = frozenset(["day", "month", "year", "short_year", "full_date"])
+NO_DATE_INFO: Dict = {"components": (None, None, None, None), "numbers": []}
 
-def generate_passwords_from_rule(
-    rule: List[Dict],
+@functools.lru_cache(maxsize=64)
+def string_key_bits(strings: Tuple[str, ...]) -> Tuple[int, ...]:
+    # one bit per lowercased string; strings that differ only in case share a bit,
+    # so using one marks the other as used too
+    key_ids: Dict[str, int] = {}
+    return tuple(1 << key_ids.setdefault(s.lower(), len(key_ids)) for s in strings)
+
+def iter_passwords_from_rule(
+    rule: Tuple[Dict, ...],
     strings: List[str],
     numbers: List[str],
     date_info_list: List[Dict],
     symbols: Optional[List[str]] = None,
     common_numbers: Optional[List[str]] = None,
     has_spaces: bool = False
-) -> Set[str]:
+) -> Iterator[str]:
     if symbols is None:
         symbols = []
     if common_numbers is None:
         common_numbers = []
     valid_strings = [s for s in strings if s]
-    date_components_in_rule = [t["type"] for t in rule if t["type"] in ["day", "month", "year", "short_year", "full_date"]]
-    has_date_components = len(date_components_in_rule) > 0
-
-    def join_tokens(tokens: List[str]) -> str:
-        return " ".join(tokens) if has_spaces else "".join(tokens)
-
-    all_passwords: Set[str] = set()
-
-    if has_date_components:
-        for date_info in date_info_list:
-            date_components = date_info.get('components', (None, None, None, None))
-            date_numbers = date_info.get('numbers', [])
-            day, month, year, short_year = date_components
-
-            base_tokens: List[Optional[str]] = []
-            for token_rule in rule:
-                if token_rule["type"] == "literal":
-                    base_tokens.append(token_rule["value"])
-                else:
-                    base_tokens.append(None)
-
-            configs: List[Tuple[List[Optional[str]], Set[str]]] = [(base_tokens.copy(), set())]
-
-            for i, token_rule in enumerate(rule):
-                new_configs: List[Tuple[List[Optional[str]], Set[str]]] = []
-                token_type = token_rule["type"]
-
-                for config, used_strings in configs:
-                    if token_type in ["string", "string_leet"]:
-                        available_strings = [s for s in valid_strings if s.lower() not in used_strings] or (valid_strings[:1] if valid_strings else [])
-                        for string in available_strings:
-                            new_config = config.copy()
-                            new_used_strings = used_strings.copy()
-                            adjusted_string = apply_case_pattern(token_rule["case_pattern"], string)
-                            if token_type == "string_leet":
-                                variants = generate_leet_variants(adjusted_string)
-                                for variant in variants:
-                                    variant_config = new_config.copy()
-                                    variant_config[i] = variant
-                                    variant_used_strings = new_used_strings.copy()
-                                    variant_used_strings.add(string.lower())
-                                    new_configs.append((variant_config, variant_used_strings))
-                            else:
-                                new_config[i] = adjusted_string
-                                new_used_strings.add(string.lower())
-                                new_configs.append((new_config, new_used_strings))
-
-                    elif token_type == "character":
-                        available_strings = [s for s in valid_strings if s.lower() not in used_strings] or (valid_strings[:1] if valid_strings else [])
-                        for string in available_strings:
-                            if string:
-                                new_config = config.copy()
-                                new_used_strings = used_strings.copy()
-                                new_config[i] = apply_case_pattern(token_rule["case_pattern"], string[0])
-                                new_used_strings.add(string.lower())
-                                new_configs.append((new_config, new_used_strings))
-
-                    elif token_type == "day":
-                        if day:
-                            new_config = config.copy()
-                            new_config[i] = day
-                            new_configs.append((new_config, used_strings))
-                    elif token_type == "month":
-                        if month:
-                            new_config = config.copy()
-                            new_config[i] = month
-                            new_configs.append((new_config, used_strings))
-                    elif token_type == "year":
-                        if year:
-                            new_config = config.copy()
-                            new_config[i] = year
-                            new_configs.append((new_config, used_strings))
-                    elif token_type == "short_year":
-                        if short_year:
-                            new_config = config.copy()
-                            new_config[i] = short_year
-                            new_configs.append((new_config, used_strings))
-                    elif token_type == "full_date":
-                        for date_num in date_numbers:
-                            new_config = config.copy()
-                            new_config[i] = date_num
-                            new_configs.append((new_config, used_strings))
-                    elif token_type == "symbol":
-                        for symbol in symbols:
-                            new_config = config.copy()
-                            new_config[i] = symbol
-                            new_configs.append((new_config, used_strings))
-                    elif token_type == "common_number":
-                        for num in common_numbers:
-                            new_config = config.copy()
-                            new_config[i] = num
-                            new_configs.append((new_config, used_strings))
-                    elif token_type == "number":
-                        for num in numbers:
-                            new_config = config.copy()
-                            new_config[i] = num
-                            new_configs.append((new_config, used_strings))
-                    elif token_type == "literal":
-                        new_configs.append((config, used_strings))
-
-                if not new_configs and token_type != "literal":
-                    new_configs.append((config, used_strings))
-                configs = new_configs
-
-            for config, _ in configs:
-                filled_tokens = [t if t is not None else "" for t in config]
-                password = join_tokens(filled_tokens)
-                if password:
-                    all_passwords.add(password)
-
-    else:
-        base_tokens: List[Optional[str]] = []
-        for token_rule in rule:
-            if token_rule["type"] == "literal":
-                base_tokens.append(token_rule["value"])
-            else:
-                base_tokens.append(None)
-
-        configs: List[Tuple[List[Optional[str]], Set[str]]] = [(base_tokens.copy(), set())]
-
-        for i, token_rule in enumerate(rule):
-            new_configs: List[Tuple[List[Optional[str]], Set[str]]] = []
-            token_type = token_rule["type"]
-
-            for config, used_strings in configs:
-                if token_type in ["string", "string_leet"]:
-                    available_strings = [s for s in valid_strings if s.lower() not in used_strings] or (valid_strings[:1] if valid_strings else [])
-                    for string in available_strings:
-                        new_config = config.copy()
-                        new_used_strings = used_strings.copy()
-                        adjusted_string = apply_case_pattern(token_rule["case_pattern"], string)
-                        if token_type == "string_leet":
-                            variants = generate_leet_variants(adjusted_string)
-                            for variant in variants:
-                                variant_config = new_config.copy()
-                                variant_config[i] = variant
-                                variant_used_strings = new_used_strings.copy()
-                                variant_used_strings.add(string.lower())
-                                new_configs.append((variant_config, variant_used_strings))
-                        else:
-                            new_config[i] = adjusted_string
-                            new_used_strings.add(string.lower())
-                            new_configs.append((new_config, new_used_strings))
-
-                elif token_type == "character":
-                    available_strings = [s for s in valid_strings if s.lower() not in used_strings] or (valid_strings[:1] if valid_strings else [])
-                    for string in available_strings:
-                        if string:
-                            new_config = config.copy()
-                            new_used_strings = used_strings.copy()
-                            new_config[i] = apply_case_pattern(token_rule["case_pattern"], string[0])
-                            new_used_strings.add(string.lower())
-                            new_configs.append((new_config, new_used_strings))
-                elif token_type == "symbol":
-                    for symbol in (symbols or []):
-                        new_config = config.copy()
-                        new_config[i] = symbol
-                        new_configs.append((new_config, used_strings))
-                elif token_type == "common_number":
-                    for num in (common_numbers or []):
-                        new_config = config.copy()
-                        new_config[i] = num
-                        new_configs.append((new_config, used_strings))
-                elif token_type == "number":
-                    for num in numbers:
-                        new_config = config.copy()
-                        new_config[i] = num
-                        new_configs.append((new_config, used_strings))
-                elif token_type == "literal":
-                    new_configs.append((config, used_strings))
-
-            if not new_configs and token_type != "literal":
-                new_configs.append((config, used_strings))
-            configs = new_configs
-
-        for config, _ in configs:
-            filled_tokens = [t if t is not None else "" for t in config]
-            password = "".join(filled_tokens)
-            if password:
-                all_passwords.add(password)
-
-    return all_passwords
+    has_date_components = any(t["type"] in DATE_TOKEN_TYPES for t in rule)
+
+    # has_spaces only ever applied to rules with date components
+    joiner = " ".join if has_spaces and has_date_components else "".join
+
+    # Resolve every slot's candidate values once per rule; the expansion below only
+    # picks from these tables instead of re-applying case/leet per partial password.
+    # string_options[i][k] holds the values string k can take in slot i.
+    string_options: Dict[int, List[List[str]]] = {}
+    for i, token_rule in enumerate(rule):
+        token_type = token_rule["type"]
+        if token_type == "string":
+            string_options[i] = [[apply_case_pattern(token_rule["case"], s)] for s in valid_strings]
+        elif token_type == "string_leet":
+            string_options[i] = [generate_leet_variants(apply_case_pattern(token_rule["case"], s)) for s in valid_strings]
+        elif token_type == "character":
+            string_options[i] = [[apply_case_pattern(token_rule["case"], s[0])] for s in valid_strings]
+
+    def slot_values(date_components: Tuple, date_numbers: List[str]) -> List[List[str]]:
+        day, month, year, short_year = date_components
+        values_by_type = {
+            "day": [day] if day else [],
+            "month": [month] if month else [],
+            "year": [year] if year else [],
+            "short_year": [short_year] if short_year else [],
+            "full_date": date_numbers,
+            "symbol": symbols,
+            "common_number": common_numbers,
+            "number": numbers,
+        }
+        return [values_by_type.get(t["type"], []) for t in rule]
+
+    key_bits = string_key_bits(tuple(valid_strings))
+    string_ids = list(range(len(valid_strings)))
+    slots = [i for i, t in enumerate(rule) if t["type"] != "literal"]
+    depth = len(slots)
+
+    # candidate values of a string slot, with the used mask after placing each,
+    # per incoming used mask
+    string_choices: Dict[Tuple[int, int], Tuple[List[str], List[int]]] = {}
+
+    def choices_for(i: int, used: int, values: List[List[str]]) -> Tuple[List[str], Optional[List[int]]]:
+        # other slots leave the used mask alone, signalled by masks=None
+        options = string_options.get(i)
+        if options is None:
+            return values[i], None
+        choices = string_choices.get((i, used))
+        if choices is None:
+            available = [k for k in string_ids if not used & key_bits[k]] or string_ids[:1]
+            choices = (
+                [value for k in available for value in options[k]],
+                [used | key_bits[k] for k in available for _ in options[k]],
+            )
+            string_choices[(i, used)] = choices
+        return choices
+
+    def expand(values: List[List[str]]) -> List[str]:
+        # depth-first over the slots with one mutable buffer; every slot is
+        # overwritten before descending, so nothing needs restoring
+        cur = [t["value"] if t["type"] == "literal" else "" for t in rule]
+        out: List[str] = []
+        emit = out.append
+
+        # Trailing slots with fixed, non-empty candidate lists (numbers, symbols,
+        # dates) don't depend on earlier choices, so from depth `tail` on the
+        # combinations are materialized by itertools.product + map in C.
+        tail = depth
+        while tail and slots[tail - 1] not in string_options and values[slots[tail - 1]]:
+            tail -= 1
+        tail_slots = frozenset(slots[tail:])
+
+        def fill(d: int, used: int, is_last: bool) -> None:
+            if d == tail:
+                factors = [values[j] if j in tail_slots else (cur[j],) for j in range(len(cur))]
+                out.extend(map(joiner, itertools.product(*factors)))
+                return
+            i = slots[d]
+            choices, masks = choices_for(i, used, values)
+            leaf = d + 1 == depth
+            if not choices:
+                # a slot without candidates stays empty, and only the last partial
+                # password in expansion order is carried past it
+                if is_last:
+                    cur[i] = ""
+                    if leaf:
+                        emit(joiner(cur))
+                    else:
+                        fill(d + 1, used, True)
+                return
+            if leaf:
+                for value in choices:
+                    cur[i] = value
+                    emit(joiner(cur))
+                return
+            last = len(choices) - 1
+            for n, value in enumerate(choices):
+                cur[i] = value
+                fill(d + 1, used if masks is None else masks[n], is_last and n == last)
+
+        fill(0, 0, True)
+        return out
+
+    # yield each password once, in expansion order, so a rule's output order is
+    # stable between runs and can be resumed by position
+    seen: Set[str] = set()
+
+    # rules without date tokens run once against an empty date
+    for date_info in (date_info_list if has_date_components else [NO_DATE_INFO]):
+        date_components = date_info.get('components', (None, None, None, None))
+        date_numbers = date_info.get('numbers', [])
+
+        for password in expand(slot_values(date_components, date_numbers)):
+            if password and password not in seen:
+                seen.add(password)
+                yield password
 
 # =============================================================================
 # Generation and session logic
@@ -506,19 +588,62 @@ DEFAULT_COMMON_NUMBERS = [
     "2020","2021","2022","2023","2024","2025","2026"
 ]
 
+_RUN_FILE_PATTERNS: Dict[str, re.Pattern] = {}
+
+def run_file_pattern(session_id: str) -> re.Pattern:
+    pattern = _RUN_FILE_PATTERNS.get(session_id)
+    if pattern is None:
+        pattern = re.compile(rf"(\d+)_passwords_{re.escape(session_id)}_run(\d+)\.txt")
+        _RUN_FILE_PATTERNS[session_id] = pattern
+    return pattern
+
+def scan_next_run_index(session_id: str) -> int:
+    existing_runs = []
+    pattern = run_file_pattern(session_id)
+    marker = f"_passwords_{session_id}_run"
+    with os.scandir(OUTPUT_DIR) as entries:
+        for entry in entries:
+            fname = entry.name
+            # cheap substring test first; most files belong to other sessions
+            if marker not in fname or not fname.endswith(".txt"):
+                continue
+            m = pattern.match(fname)
+            if m:
+                try:
+                    existing_runs.append(int(m.group(2)))
+                except ValueError:
+                    pass
+    return max(existing_runs) + 1 if existing_runs else 1
+
+# parsed rules.txt, reused while the file's (mtime, size) stamp is unchanged
+_RULES_CACHE: Dict = {"stamp": None, "data": None}
+
 def read_rules() -> List[str]:
-    if not os.path.exists(RULES_PATH):
+    stamp = _file_stamp(RULES_PATH)
+    if stamp is None:
         print(color(f"rules.txt not found at: {RULES_PATH}", C.BRIGHT_RED))
         sys.exit(1)
+    if _RULES_CACHE["stamp"] == stamp:
+        return _RULES_CACHE["data"]
     with open(RULES_PATH, "r", encoding="utf-8") as f:
-        return [line.strip() for line in f if line.strip()]
-
-def create_session(data: Dict) -> Dict:
-    sessions = load_sessions()
-    session = {
-        "session_id": data.get("session_id", generate_session_id()),
-        "created_at": now_iso(),
-        "updated_at": now_iso(),
+        rules = [line for line in map(str.strip, f.read().split("\n")) if line]
+    _RULES_CACHE["stamp"] = stamp
+    _RULES_CACHE["data"] = rules
+    return rules
+
+# id prefix of sessions that are never written to sessions.json
+EPHEMERAL_PREFIX = "ephemeral_"
+
+def is_ephemeral(session: Dict) -> bool:
+    return session["session_id"].startswith(EPHEMERAL_PREFIX)
+
+def build_session(data: Dict) -> Dict:
+    # a fresh session record; shared by saved and ephemeral sessions
+    created_at = now_iso()
+    return {
+        "session_id": data.get("session_id") or generate_session_id(),
+        "created_at": created_at,
+        "updated_at": created_at,
         "strings": data.get("strings", []),
         "dates": data.get("dates", []),
         "numbers": data.get("numbers", []),
@@ -530,8 +655,13 @@ def create_session(data: Dict) -> Dict:
         "current_rule_password_count": 0,
         "is_completed": False,
         "last_run_files": [],
-        "total_generated": 0
+        "total_generated": 0,
+        "next_run_index": 1
     }
+
+def create_session(data: Dict) -> Dict:
+    sessions = load_sessions()
+    session = build_session(data)
     sessions.append(session)
     save_sessions(sessions)
     return session
@@ -548,7 +678,7 @@ def update_session(session_id: str, **updates) -> Dict:
             break
     if found is None:
         raise FileNotFoundError("Session not found")
-    save_sessions(sessions)
+    schedule_sessions_flush(sessions)
     return found
 
 def load_session_by_id(session_id: str) -> Dict:
@@ -558,46 +688,415 @@ def load_session_by_id(session_id: str) -> Dict:
             return s
     raise FileNotFoundError("Session not found")
 
-def list_sessions_print() -> List[Dict]:
+def list_sessions_print() -> List[Tuple[str, str]]:
+    # returns (session_id, table row) pairs; the full record is fetched by id once picked
     sessions = load_sessions()
-    sessions_sorted = sorted(sessions, key=lambda x: x.get("updated_at",""), reverse=True)
-    if not sessions_sorted:
+    if not sessions:
         print(color("No sessions available.", C.BRIGHT_YELLOW))
         return []
-    print(color("\nAvailable sessions:", C.BRIGHT_WHITE, C.BOLD))
     header = "Idx | session_id   | created_at                | strings                       | dates                | generated | status"
-    print(color(header, C.BRIGHT_GREEN))
-    print(color("-"*len(header), C.BRIGHT_GREEN))
-    for idx, s in enumerate(sessions_sorted, start=1):
+    rows = []
+    for idx, s in enumerate(sorted(sessions, key=lambda x: x.get("updated_at",""), reverse=True), start=1):
         strings_preview = " ".join(s.get("strings", []))[:27]
         dates_preview = " ".join(s.get("dates", []))[:20] or "-"
         generated = s.get("total_generated", 0)
         status = "completed" if s.get("is_completed") else "in-progress"
         line = f"{idx:<3} | {s['session_id']:<12} | {s['created_at']:<24} | {strings_preview:<28} | {dates_preview:<20} | {generated:>9} | {status}"
-        print(color(line, C.BRIGHT_WHITE))
-    print()
-    return sessions_sorted
+        rows.append((s["session_id"], line))
+    print(color("\nAvailable sessions:", C.BRIGHT_WHITE, C.BOLD))
+    print(color(header, C.BRIGHT_GREEN))
+    print(color("-"*len(header), C.BRIGHT_GREEN))
+    sys.stdout.write("".join(color(line, C.BRIGHT_WHITE) + "\n" for _, line in rows) + "\n")
+    return rows
+
+# character-class requirements as bits, combined once per run
+HAS_UPPER = 1
+HAS_SYMBOL = 2
+
+def required_flags(must_upper: bool, must_symbol: bool) -> int:
+    return (HAS_UPPER if must_upper else 0) | (HAS_SYMBOL if must_symbol else 0)
+
+def password_flags(p: str, required: int) -> int:
+    # which of the `required` classes occur in p
+    flags = 0
+    if p.isascii():
+        # lower() only changes A-Z; isalnum() is the per-character check in C
+        if required & HAS_UPPER and p.lower() != p:
+            flags |= HAS_UPPER
+        if required & HAS_SYMBOL and p and not p.isalnum():
+            flags |= HAS_SYMBOL
+        return flags
+    # one pass over the characters, stopping once every required class was seen
+    for c in p:
+        if c.isupper():
+            flags |= HAS_UPPER
+        if not c.isalnum():
+            flags |= HAS_SYMBOL
+        if flags & required == required:
+            break
+    return flags & required
+
+@functools.lru_cache(maxsize=64)
+def password_filter(min_len: Optional[int], max_len: Optional[int],
+                    required: int) -> Optional[Callable[[str], bool]]:
+    # generate a predicate holding only the checks this run needs, with the
+    # bounds inlined as constants; None when nothing has to be checked
+    conds = []
+    if min_len and max_len:
+        conds.append(f"{int(min_len)} <= len(p) <= {int(max_len)}")
+    elif min_len:
+        conds.append(f"len(p) >= {int(min_len)}")
+    elif max_len:
+        conds.append(f"len(p) <= {int(max_len)}")
+    if required:
+        conds.append(f"password_flags(p, {int(required)}) == {int(required)}")
+    if not conds:
+        return None
+    ns = {"password_flags": password_flags}
+    exec("def ok(p):\n    return " + " and ".join(conds) + "\n", ns)
+    return ns["ok"]
+
+def filter_valid_passwords(passwords: Iterable[str], min_len: Optional[int], max_len: Optional[int],
+                           required: int) -> Iterator[str]:
+    ok = password_filter(min_len, max_len, required)
+    if ok is None:
+        return iter(passwords)
+    return filter(ok, passwords)
+
+WRITE_BUFFER_SIZE = 1 << 20  # bytes collected before each output write
+PROGRESS_INTERVAL = 0.033  # seconds between progress redraws (~30 Hz)
+
+_PROGRESS_FMT = ("\r" + C.BRIGHT_GREEN + "{}/{}" + C.RESET).format
+
+def print_progress(done: int, total: int) -> None:
+    sys.stdout.write(_PROGRESS_FMT(done, total))
+    sys.stdout.flush()
+
+def make_progress(total: int) -> Callable[[int], None]:
+    # progress redraws are only useful on a terminal; skip them for pipes/files
+    if not sys.stdout.isatty():
+        return lambda done: None
+    next_tick = 0.0
+
+    def progress(done: int) -> None:
+        nonlocal next_tick
+        if time.monotonic() >= next_tick:
+            print_progress(done, total)
+            next_tick = time.monotonic() + PROGRESS_INTERVAL
+    return progress
+
+def append_lines(buf: bytearray, lines: List[str]) -> int:
+    # encodes lines onto the end of buf, newline-terminated; returns the bytes added
+    if not lines:
+        return 0
+    start = len(buf)
+    buf += "\n".join(lines).encode("utf-8")
+    buf += b"\n"
+    return len(buf) - start
+
+# rules per worker task, and tasks kept queued per worker, for parallel runs
+PARALLEL_BATCH_WEIGHT = 20000  # estimated passwords per worker task
+PARALLEL_RULES_PER_TASK = 1024  # cap on rules per task when the estimates are tiny
+PARALLEL_TASKS_PER_WORKER = 4
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+_DATE_COMPONENT_INDEX = {"day": 0, "month": 1, "year": 2, "short_year": 3}
+
+# per-token (min, max) lengths for the current inputs, reset whenever they change
+_TOKEN_BOUNDS: Dict = {"inputs": None, "bounds": {}}
+
+def token_length_bounds(token: Dict, strings: List[str], numbers: List[str],
+                        date_info_list: List[Dict]) -> Tuple[int, int]:
+    t = token["type"]
+    if t == "literal":
+        n = len(token["value"])
+        return n, n
+    inputs = _TOKEN_BOUNDS["inputs"]
+    if inputs is None or inputs[0] is not strings or inputs[1] is not numbers or inputs[2] is not date_info_list:
+        _TOKEN_BOUNDS["inputs"] = (strings, numbers, date_info_list)
+        _TOKEN_BOUNDS["bounds"] = {}
+    bounds = _TOKEN_BOUNDS["bounds"]
+    key = (t, token.get("case"))
+    span = bounds.get(key)
+    if span is None:
+        if t == "string" or t == "string_leet":
+            # leet swaps one character for one, so only the case can change lengths
+            lengths = [len(apply_case_pattern(token["case"], s)) for s in strings if s]
+        elif t == "character":
+            lengths = [len(apply_case_pattern(token["case"], s[0])) for s in strings if s]
+        elif t in _DATE_COMPONENT_INDEX:
+            k = _DATE_COMPONENT_INDEX[t]
+            lengths = [len(info.get("components", NO_DATE_INFO["components"])[k] or "") for info in date_info_list]
+        elif t == "full_date":
+            lengths = [len(n) for info in date_info_list for n in info.get("numbers") or [""]]
+        elif t == "symbol":
+            lengths = [len(v) for v in DEFAULT_SYMBOLS]
+        elif t == "common_number":
+            lengths = [len(v) for v in DEFAULT_COMMON_NUMBERS]
+        else:
+            lengths = [len(v) for v in numbers]
+        # a slot without candidates stays empty
+        span = bounds[key] = (min(lengths), max(lengths)) if lengths else (0, 0)
+    return span
+
+def rule_length_bounds(rule: Tuple[Dict, ...], has_spaces: bool, strings: List[str], numbers: List[str],
+                       date_info_list: List[Dict]) -> Tuple[int, int]:
+    # shortest and longest password the rule can produce for these inputs
+    lo = hi = 0
+    has_date_components = False
+    for token in rule:
+        a, b = token_length_bounds(token, strings, numbers, date_info_list)
+        lo += a
+        hi += b
+        has_date_components = has_date_components or token["type"] in DATE_TOKEN_TYPES
+    if has_spaces and has_date_components:
+        lo += len(rule) - 1
+        hi += len(rule) - 1
+    return lo, hi
+
+def rule_passwords(rule_str: str, strings: List[str], numbers: List[str], date_info_list: List[Dict],
+                   min_length: Optional[int], max_length: Optional[int],
+                   required: int) -> Iterator[str]:
+    has_spaces = " + " in rule_str and "literal: " in rule_str
+    rule = parse_rule(rule_str)
+    if min_length or max_length:
+        # skip rules that can't meet the length limits, and drop the checks that
+        # every password of the rule passes anyway
+        lo, hi = rule_length_bounds(rule, has_spaces, strings, numbers, date_info_list)
+        if (min_length and hi < min_length) or (max_length and lo > max_length):
+            return iter(())
+        if min_length and lo >= min_length:
+            min_length = None
+        if max_length and hi <= max_length:
+            max_length = None
+    passwords = iter_passwords_from_rule(
+        rule, strings, numbers, date_info_list,
+        symbols=DEFAULT_SYMBOLS,
+        common_numbers=DEFAULT_COMMON_NUMBERS,
+        has_spaces=has_spaces
+    )
+    return filter_valid_passwords(passwords, min_length, max_length, required)
+
+def write_rules_sequential(outfile, rules: List[str], rule_index: int, skip: int, gen_args: Tuple,
+                           password_limit: int, progress: Callable[[int], None]
+                           ) -> Tuple[int, List[str], int, int]:
+    total_written = 0
+    preview_passwords: List[str] = []
+    rule_count = skip
+    buf = bytearray()
+    while total_written < password_limit and rule_index < len(rules):
+        valid_passwords = rule_passwords(rules[rule_index], *gen_args)
+
+        # resume mid-rule by skipping what earlier runs already wrote
+        remaining = password_limit - total_written
+        chunk = list(itertools.islice(valid_passwords, skip, skip + remaining))
+        append_lines(buf, chunk)
+        if len(preview_passwords) < 100:
+            preview_passwords.extend(chunk[:100 - len(preview_passwords)])
+        total_written += len(chunk)
+        rule_count = skip + len(chunk)
+
+        if len(buf) >= WRITE_BUFFER_SIZE:
+            outfile.write(buf)
+            buf.clear()
+        progress(total_written)
+
+        if len(chunk) < remaining or next(valid_passwords, None) is None:
+            rule_index += 1
+            rule_count = 0
+            skip = 0
+        else:
+            break
 
-def filter_valid_passwords(passwords: Set[str], min_len: Optional[int], max_len: Optional[int],
-                           must_upper: bool, must_symbol: bool) -> List[str]:
-    def ok(p: str) -> bool:
-        if min_len and len(p) < min_len:
-            return False
-        if max_len and len(p) > max_len:
-            return False
-        if must_upper and not any(c.isupper() for c in p):
-            return False
-        if must_symbol and not any(not c.isalnum() for c in p):
-            return False
-        return True
-    return [p for p in passwords if ok(p)]
+    outfile.write(buf)
+    return total_written, preview_passwords, rule_index, rule_count
+
+@functools.lru_cache(maxsize=4096)
+def rule_weight(rule_str: str, n_strings: int, n_numbers: int, n_dates: int) -> int:
+    # rough size of a rule's expansion before filtering; only used to balance batches
+    weight = 1
+    has_date = False
+    for token in parse_rule(rule_str):
+        t = token["type"]
+        if t == "string" or t == "character":
+            weight *= max(n_strings, 1)
+        elif t == "string_leet":
+            weight *= 4 * max(n_strings, 1)
+        elif t == "full_date":
+            weight *= 8
+            has_date = True
+        elif t in DATE_TOKEN_TYPES:
+            has_date = True
+        elif t == "symbol":
+            weight *= len(DEFAULT_SYMBOLS)
+        elif t == "common_number":
+            weight *= len(DEFAULT_COMMON_NUMBERS)
+        elif t == "number":
+            weight *= max(n_numbers, 1)
+    if has_date:
+        weight *= max(n_dates, 1)
+    return weight
+
+def weighted_batches(rules: List[str], rule_index: int, gen_args: Tuple) -> Iterator[Tuple[int, int, int]]:
+    # contiguous (first, end, weight) rule ranges of about PARALLEL_BATCH_WEIGHT each;
+    # a heavy rule gets a batch of its own
+    n_strings, n_numbers, n_dates = len(gen_args[0]), len(gen_args[1]), len(gen_args[2])
+    first, weight = rule_index, 0
+    for i in range(rule_index, len(rules)):
+        weight += rule_weight(rules[i], n_strings, n_numbers, n_dates)
+        if weight >= PARALLEL_BATCH_WEIGHT or i + 1 - first >= PARALLEL_RULES_PER_TASK:
+            yield first, i + 1, weight
+            first, weight = i + 1, 0
+    if first < len(rules):
+        yield first, len(rules), weight
+
+def expand_rule_batch(rule_strs: List[str], skip: int, gen_args: Tuple, part_path: str) -> List[Tuple[int, int]]:
+    # worker side: writes every valid password of each rule to part_path, the first
+    # rule resumed `skip` in; returns (password count, byte length) per rule
+    sizes = []
+    buf = bytearray()
+    with open(part_path, "wb") as part:
+        for rule_str in rule_strs:
+            passwords = list(itertools.islice(rule_passwords(rule_str, *gen_args), skip, None))
+            sizes.append((len(passwords), append_lines(buf, passwords)))
+            if len(buf) >= WRITE_BUFFER_SIZE:
+                part.write(buf)
+                buf.clear()
+            skip = 0
+        part.write(buf)
+    return sizes
+
+# kernel-side file copies, tried in order: (src_fd, dst_fd, src_offset, count) -> bytes copied
+_KERNEL_COPIES: List[Callable[[int, int, int, int], int]] = []
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIES.append(lambda src_fd, dst_fd, offset, count: os.copy_file_range(src_fd, dst_fd, count, offset_src=offset))
+if hasattr(os, "sendfile"):
+    _KERNEL_COPIES.append(lambda src_fd, dst_fd, offset, count: os.sendfile(dst_fd, src_fd, offset, count))
+
+def copy_file_span(src, dst, offset: int, nbytes: int) -> None:
+    # appends src[offset:offset + nbytes] to dst without passing the bytes through
+    # Python where the platform allows it; plain reads and writes otherwise
+    if nbytes <= 0:
+        return
+    dst.flush()
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    end = offset + nbytes
+    for kernel_copy in _KERNEL_COPIES:
+        try:
+            while offset < end:
+                copied = kernel_copy(src_fd, dst_fd, offset, end - offset)
+                if not copied:
+                    break
+                offset += copied
+        except OSError:
+            continue
+        if offset >= end:
+            break
+    src.seek(offset)
+    while offset < end:
+        data = src.read(min(end - offset, WRITE_BUFFER_SIZE))
+        if not data:
+            break
+        dst.write(data)
+        offset += len(data)
+    # the kernel moved the fd offset behind the buffered writer's back
+    dst.seek(0, os.SEEK_END)
+
+def read_lines(src, nbytes: int, wanted: int) -> List[str]:
+    # first `wanted` complete lines of src[:nbytes], read a chunk at a time
+    src.seek(0)
+    data = b""
+    while data.count(b"\n") < wanted and len(data) < nbytes:
+        data += src.read(min(nbytes - len(data), 1 << 16))
+    return [line.decode("utf-8") for line in data.split(b"\n")[:min(wanted, data.count(b"\n"))]]
+
+def write_rules_parallel(outfile, rules: List[str], rule_index: int, skip: int, gen_args: Tuple,
+                         password_limit: int, progress: Callable[[int], None],
+                         workers: int, part_prefix: str) -> Tuple[int, List[str], int, int]:
+    # Rules are independent, so contiguous batches are expanded by worker processes
+    # into part files while the parent appends finished parts in rule order. Batches
+    # are sized by estimated yield, and only a bounded window is queued: no more
+    # than the estimate says is still needed once every worker has a batch. The
+    # output and the resume cursor are exactly those of a sequential run.
+    total_written = 0
+    queued_weight = 0
+    preview_passwords: List[str] = []
+    rule_count = skip
+    part_paths: List[str] = []
+    pending: deque = deque()
+    start_index, start_skip = rule_index, skip
+    batches = weighted_batches(rules, rule_index, gen_args)
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    def fill() -> None:
+        nonlocal queued_weight
+        while len(pending) < workers * PARALLEL_TASKS_PER_WORKER:
+            if len(pending) >= workers and queued_weight >= password_limit - total_written:
+                return
+            batch = next(batches, None)
+            if batch is None:
+                return
+            first, end, weight = batch
+            part_path = f"{part_prefix}_part{len(part_paths)}.txt"
+            part_paths.append(part_path)
+            batch_skip = start_skip if first == start_index else 0
+            future = executor.submit(expand_rule_batch, rules[first:end], batch_skip, gen_args, part_path)
+            pending.append((part_path, weight, future))
+            queued_weight += weight
+
+    try:
+        fill()
+        while pending and total_written < password_limit:
+            part_path, weight, future = pending.popleft()
+            queued_weight -= weight
+            sizes = future.result()
+            with open(part_path, "rb") as part:
+                whole = 0  # bytes of the rules taken in full, copied in one go
+                tail = b""
+                for count, nbytes in sizes:
+                    remaining = password_limit - total_written
+                    if remaining <= 0:
+                        break
+                    if count > remaining:
+                        # the limit falls inside this rule: keep its first lines only
+                        part.seek(whole)
+                        data = part.read(nbytes)
+                        tail = b"\n".join(data.split(b"\n", remaining)[:remaining]) + b"\n"
+                        total_written += remaining
+                        rule_count = skip + remaining
+                        break
+                    whole += nbytes
+                    total_written += count
+                    rule_index += 1
+                    rule_count = 0
+                    skip = 0
+                if len(preview_passwords) < 100:
+                    preview_passwords.extend(read_lines(part, whole, 100 - len(preview_passwords)))
+                    if tail and len(preview_passwords) < 100:
+                        preview_passwords.extend(tail[:-1].decode("utf-8").split("\n")[:100 - len(preview_passwords)])
+                copy_file_span(part, outfile, 0, whole)
+                outfile.write(tail)
+            os.remove(part_path)
+            progress(total_written)
+            if total_written < password_limit:
+                fill()
+    finally:
+        executor.shutdown(cancel_futures=True)
+        for part_path in part_paths:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+    return total_written, preview_passwords, rule_index, rule_count
 
 def generate_to_file(
     session: Dict,
     rules: List[str],
     password_limit: int,
-    custom_output_name: Optional[str] = None
+    custom_output_name: Optional[str] = None,
+    workers: int = 1
 ) -> Tuple[int, str, List[str], Dict]:
+    # persist pending session changes (and stop the flush timer) before workers fork
+    flush_sessions()
     session_id = session["session_id"]
     current_rule_index = session.get("current_rule_index", 0)
     current_rule_password_count = session.get("current_rule_password_count", 0)
@@ -606,12 +1105,10 @@ def generate_to_file(
     if current_rule_index >= total_rules:
         return 0, "", [], {"is_completed": True}
 
-    symbol_list = DEFAULT_SYMBOLS
-    common_nums = DEFAULT_COMMON_NUMBERS
-
-    strings = session["strings"]
+    # inputs are reused by every rule (cache keys, joins); intern them once per run
+    strings = [sys.intern(s) for s in session["strings"]]
     dates = session["dates"]
-    numbers = session["numbers"]
+    numbers = [sys.intern(n) for n in session["numbers"]]
     min_length = session.get("min_length", 8)
     max_length = session.get("max_length")
     must_include_uppercase = session.get("must_include_uppercase", False)
@@ -619,63 +1116,32 @@ def generate_to_file(
 
     date_info_list = [{
         'components': parse_date(d),
-        'numbers': generate_numbers_from_date(d)
+        'numbers': [sys.intern(n) for n in generate_numbers_from_date(d)]
     } for d in dates]
+    gen_args = (strings, numbers, date_info_list, min_length, max_length,
+                required_flags(must_include_uppercase, must_include_symbol))
 
-    existing_runs = []
-    pattern = re.compile(rf"(\d+)_passwords_{re.escape(session_id)}_run(\d+)\.txt")
-    for fname in os.listdir(OUTPUT_DIR):
-        m = pattern.match(fname)
-        if m:
-            try:
-                existing_runs.append(int(m.group(2)))
-            except Exception:
-                pass
-    next_run_index = max(existing_runs) + 1 if existing_runs else 1
+    next_run_index = session.get("next_run_index")
+    if next_run_index is None:
+        # sessions saved before the counter existed
+        next_run_index = scan_next_run_index(session_id)
     temp_path = os.path.join(OUTPUT_DIR, f"temp_{session_id}_run{next_run_index}.txt")
 
-    total_written = 0
-    preview_passwords: List[str] = []
-    rule_index_updated = current_rule_index
-    new_current_rule_password_count = current_rule_password_count
-
-    with open(temp_path, "w", encoding="utf-8") as outfile:
-        while total_written < password_limit and rule_index_updated < total_rules:
-            rule_str = rules[rule_index_updated]
-            rule = parse_rule(rule_str)
-            has_spaces = " + " in rule_str and "literal: " in rule_str
-
-            all_passwords = generate_passwords_from_rule(
-                rule, strings, numbers, date_info_list,
-                symbols=symbol_list,
-                common_numbers=common_nums,
-                has_spaces=has_spaces
+    progress = make_progress(password_limit)
+    with open(temp_path, "wb", buffering=WRITE_BUFFER_SIZE) as outfile:
+        if workers > 1:
+            result = write_rules_parallel(
+                outfile, rules, current_rule_index, current_rule_password_count, gen_args,
+                password_limit, progress, workers, os.path.splitext(temp_path)[0]
             )
-
-            valid_passwords = filter_valid_passwords(
-                all_passwords, min_length, max_length,
-                must_include_uppercase, must_include_symbol
+        else:
+            result = write_rules_sequential(
+                outfile, rules, current_rule_index, current_rule_password_count, gen_args,
+                password_limit, progress
             )
-
-            if rule_index_updated == current_rule_index:
-                valid_passwords = valid_passwords[current_rule_password_count:]
-
-            for pwd in valid_passwords:
-                if total_written >= password_limit:
-                    break
-                outfile.write(pwd + "\n")
-                if len(preview_passwords) < 100:
-                    preview_passwords.append(pwd)
-                total_written += 1
-                new_current_rule_password_count += 1
-                progress = color(f"{total_written}/{password_limit}", C.BRIGHT_GREEN)
-                print(f"\r{progress}", end="", flush=True)
-
-            if new_current_rule_password_count >= len(valid_passwords):
-                rule_index_updated += 1
-                new_current_rule_password_count = 0
-            else:
-                break
+    total_written, preview_passwords, rule_index_updated, new_current_rule_password_count = result
+    if total_written and sys.stdout.isatty():
+        print_progress(total_written, password_limit)
 
     if custom_output_name and custom_output_name.strip():
         final_filename = custom_output_name.strip()
@@ -695,7 +1161,8 @@ def generate_to_file(
         "current_rule_index": rule_index_updated,
         "current_rule_password_count": new_current_rule_password_count,
         "is_completed": is_completed_flag,
-        "total_generated": session.get("total_generated", 0) + total_written
+        "total_generated": session.get("total_generated", 0) + total_written,
+        "next_run_index": next_run_index + 1
     }
     list_files = session.get("last_run_files", [])
     list_files.append(final_filename)
@@ -707,12 +1174,102 @@ def generate_to_file(
 # CLI flows
 # =============================================================================
 
+def print_preview(preview: List[str]) -> None:
+    if not preview:
+        return
+    print(color("\nPreview (first up to 100 lines):", C.BRIGHT_GREEN))
+    body = "\n".join(preview)
+    if _USE_COLOR:
+        body = C.BRIGHT_WHITE + body + C.RESET
+    sys.stdout.write(body + "\n")
+
+def _is_scalar(value) -> bool:
+    return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+def _as_list(value) -> Optional[List[str]]:
+    # batch fields may be a list, a space-separated string like the prompts take,
+    # or a single number; None when the value is none of those
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return value.split()
+    if _is_scalar(value):
+        return [str(value)]
+    if isinstance(value, list) and all(map(_is_scalar, value)):
+        return [v for v in map(str, value) if v]
+    return None
+
+def _as_bool(value, default: bool) -> Optional[bool]:
+    # JSON booleans, or the answers yes_no_prompt takes; None for anything else
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        val = value.strip().lower()
+        if val == "":
+            return default
+        if val in {"y", "yes"}:
+            return True
+        if val in {"n", "no"}:
+            return False
+    return None
+
+def _cli_new_batch(text: str) -> None:
+    # headless form: one JSON object holding the answers cli_new prompts for
+    try:
+        form = json.loads(text)
+    except ValueError:
+        form = None
+    if not isinstance(form, dict):
+        print(color("Batch input must be a JSON object.", C.BRIGHT_RED))
+        return
+    lists = {}
+    for key in ("strings", "dates", "numbers"):
+        lists[key] = _as_list(form.get(key))
+        if lists[key] is None:
+            print(color(f"Invalid value for \"{key}\".", C.BRIGHT_RED))
+            return
+    if not lists["strings"]:
+        print(color("Strings are required. Please enter at least one value.", C.BRIGHT_RED))
+        return
+    flags = {}
+    for key, default in (("must_include_uppercase", False), ("must_include_symbol", False), ("save_session", True)):
+        flags[key] = _as_bool(form.get(key), default)
+        if flags[key] is None:
+            print(color(f"Invalid value for \"{key}\". Use a JSON true/false or \"yes\"/\"no\".", C.BRIGHT_RED))
+            return
+    try:
+        min_length = int(form.get("min_length", 8))
+        max_length = form.get("max_length")
+        max_length = int(max_length) if max_length not in (None, "") else None
+        password_limit = int(form.get("limit", 1000000))
+        workers = max(1, int(form.get("workers", DEFAULT_WORKERS)))
+    except (TypeError, ValueError):
+        print(_ERR_INT)
+        return
+    _run_new({
+        "strings": lists["strings"],
+        "dates": lists["dates"],
+        "numbers": lists["numbers"],
+        "min_length": min_length,
+        "max_length": max_length,
+        "must_include_uppercase": flags["must_include_uppercase"],
+        "must_include_symbol": flags["must_include_symbol"]
+    }, password_limit, workers, str(form.get("output") or ""), flags["save_session"])
+
 def cli_new() -> None:
+    if not sys.stdin.isatty():
+        text = sys.stdin.read()
+        if text.lstrip().startswith("{"):
+            return _cli_new_batch(text)
+        # plain answers piped one per line: replay them through the prompts
+        sys.stdin = io.StringIO(text)
     print()
     print(color("Enter personal strings (e.g., first name, surname, nickname, pet name), separated by space:", C.BRIGHT_GREEN))
     # strings are mandatory
     while True:
-        strings_line = input(color("> ", C.BRIGHT_CYAN)).strip()
+        strings_line = input(_PROMPT_CYAN).strip()
         strings = [s for s in strings_line.split() if s]
         if strings:
             break
@@ -720,86 +1277,71 @@ def cli_new() -> None:
 
     print()
     print(color("Enter one or more dates in D/M/YYYY format, separated by space (e.g., 11/2/2003 1/1/2000), or press Enter to skip:", C.BRIGHT_GREEN))
-    dates_line = input(color("> ", C.BRIGHT_CYAN)).strip()
+    dates_line = input(_PROMPT_CYAN).strip()
     dates = [d for d in dates_line.split() if d]
 
     print()
     print(color("Enter any number(s) (e.g., favorite number, house number, phone number), separated by space, or press Enter to skip:", C.BRIGHT_GREEN))
-    numbers_line = input(color("> ", C.BRIGHT_CYAN)).strip()
+    numbers_line = input(_PROMPT_CYAN).strip()
     numbers = [n for n in numbers_line.split() if n]
 
     while True:
         ml = prompt("\nEnter minimum password length [default: 8]", "8", show_default_hint=False)
-        try:
-            min_length = int(ml)
+        min_length = _parse_int(ml)
+        if min_length is not None:
             break
-        except ValueError:
-            print(color("Please enter a valid integer.", C.BRIGHT_RED))
+        print(_ERR_INT)
 
     mx = prompt("Enter maximum password length (press Enter to skip)", "", show_default_hint=False)
-    max_length = None
-    if mx.strip():
-        try:
-            max_length = int(mx.strip())
-        except ValueError:
-            print(color("Invalid value. Ignoring max length.", C.BRIGHT_YELLOW))
-            max_length = None
+    max_length = _parse_int(mx)
+    if max_length is None and mx.strip():
+        print(color("Invalid value. Ignoring max length.", C.BRIGHT_YELLOW))
 
     must_include_uppercase = yes_no_prompt("Must include at least one uppercase letter")
     must_include_symbol = yes_no_prompt("Must include at least one symbol")
 
     limit_str = prompt("\nHow many passwords do you want to generate [default: 1000000]", "1000000", show_default_hint=False)
-    try:
-        password_limit = int(limit_str)
-    except ValueError:
-        password_limit = 1000000
+    password_limit = _parse_int(limit_str, 1000000)
+
+    workers_str = prompt(f"Worker processes [default: {DEFAULT_WORKERS}]", str(DEFAULT_WORKERS), show_default_hint=False)
+    workers = max(1, _parse_int(workers_str, DEFAULT_WORKERS))
 
     out_name = prompt("Enter output file name (default: auto)", "", show_default_hint=False)
     save_session_flag = yes_no_prompt("\nSave session for resume", default_no=False)
 
+    _run_new({
+        "strings": strings,
+        "dates": dates,
+        "numbers": numbers,
+        "min_length": min_length,
+        "max_length": max_length,
+        "must_include_uppercase": must_include_uppercase,
+        "must_include_symbol": must_include_symbol
+    }, password_limit, workers, out_name, save_session_flag)
+
+def _run_new(data: Dict, password_limit: int, workers: int, out_name: str, save_session_flag: bool) -> None:
     if save_session_flag:
-        session = create_session({
-            "strings": strings,
-            "dates": dates,
-            "numbers": numbers,
-            "min_length": min_length,
-            "max_length": max_length,
-            "must_include_uppercase": must_include_uppercase,
-            "must_include_symbol": must_include_symbol
-        })
+        session = create_session(data)
         print(color(f"\nSession created: {session['session_id']}", C.BRIGHT_BLUE))
     else:
-        session = {
-            "session_id": f"ephemeral_{generate_session_id()}",
-            "created_at": now_iso(),
-            "updated_at": now_iso(),
-            "strings": strings,
-            "dates": dates,
-            "numbers": numbers,
-            "min_length": min_length,
-            "max_length": max_length,
-            "must_include_uppercase": must_include_uppercase,
-            "must_include_symbol": must_include_symbol,
-            "current_rule_index": 0,
-            "current_rule_password_count": 0,
-            "is_completed": False,
-            "last_run_files": [],
-            "total_generated": 0
-        }
+        session = build_session({**data, "session_id": EPHEMERAL_PREFIX + generate_session_id()})
 
     print(color("\nLoading rules...", C.BRIGHT_WHITE))
     rules = read_rules()
     print(color(f"Total rules: {len(rules)}", C.BRIGHT_WHITE))
 
-    _, final_name, preview, updates = generate_to_file(session, rules, password_limit, custom_output_name=out_name)
+    _, final_name, preview, updates = generate_to_file(session, rules, password_limit, custom_output_name=out_name,
+                                              workers=workers)
 
-    if not session["session_id"].startswith("ephemeral_"):
+    if not is_ephemeral(session):
         update_session(session["session_id"], **updates)
 
-    if preview:
-        print(color("\nPreview (first up to 100 lines):", C.BRIGHT_GREEN))
-        for p in preview:
-            print(color(p, C.BRIGHT_WHITE))
+    print_preview(preview)
+
+SESSION_DETAIL_KEYS = ("session_id", "created_at", "updated_at", "strings", "dates", "numbers",
+                       "min_length", "max_length", "must_include_uppercase", "must_include_symbol",
+                       "current_rule_index", "current_rule_password_count", "is_completed", "total_generated",
+                       "last_run_files")
 
 def cli_resume() -> None:
     sessions_sorted = list_sessions_print()
@@ -809,24 +1351,20 @@ def cli_resume() -> None:
         choice = prompt("Select session index to resume (or 0 to cancel)", "", show_default_hint=False)
         if not choice:
             continue
-        try:
-            idx = int(choice)
-        except ValueError:
+        idx = _parse_int(choice)
+        if idx is None:
             print(color("Please enter a valid number.", C.BRIGHT_RED))
             continue
         if idx == 0:
             return
         if 1 <= idx <= len(sessions_sorted):
-            session = sessions_sorted[idx - 1]
+            session = load_session_by_id(sessions_sorted[idx - 1][0])
             break
         else:
             print(color("Invalid index.", C.BRIGHT_RED))
 
     print(color("\nSession details:", C.BRIGHT_WHITE, C.BOLD))
-    for k in ["session_id","created_at","updated_at","strings","dates","numbers",
-              "min_length","max_length","must_include_uppercase","must_include_symbol",
-              "current_rule_index","current_rule_password_count","is_completed","total_generated","last_run_files"]:
-        print(color(f"- {k}: {session.get(k)}", C.BRIGHT_WHITE))
+    sys.stdout.write("".join(color(f"- {k}: {session.get(k)}", C.BRIGHT_WHITE) + "\n" for k in SESSION_DETAIL_KEYS))
 
     if session.get("is_completed"):
         print(color("\nThis session is already completed (all rules processed).", C.BRIGHT_YELLOW))
@@ -836,10 +1374,10 @@ def cli_resume() -> None:
         session = update_session(session["session_id"], current_rule_index=0, current_rule_password_count=0, is_completed=False)
 
     limit_str = prompt("\nHow many passwords to generate this run [default: 1000000]", "1000000", show_default_hint=False)
-    try:
-        password_limit = int(limit_str)
-    except ValueError:
-        password_limit = 1000000
+    password_limit = _parse_int(limit_str, 1000000)
+
+    workers_str = prompt(f"Worker processes [default: {DEFAULT_WORKERS}]", str(DEFAULT_WORKERS), show_default_hint=False)
+    workers = max(1, _parse_int(workers_str, DEFAULT_WORKERS))
 
     out_name = prompt("Enter output file name (default: auto)", "", show_default_hint=False)
 
@@ -847,33 +1385,38 @@ def cli_resume() -> None:
     rules = read_rules()
     print(color(f"Total rules: {len(rules)}", C.BRIGHT_WHITE))
 
-    _, final_name, preview, updates = generate_to_file(session, rules, password_limit, custom_output_name=out_name)
+    _, final_name, preview, updates = generate_to_file(session, rules, password_limit, custom_output_name=out_name,
+                                              workers=workers)
     session = update_session(session["session_id"], **updates)
 
-    if preview:
-        print(color("\nPreview (first up to 100 lines):", C.BRIGHT_GREEN))
-        for p in preview:
-            print(color(p, C.BRIGHT_WHITE))
+    print_preview(preview)
 
 # =============================================================================
 # Main
 # =============================================================================
 
-def main():
+_MODES: Dict[str, Callable[[], None]] = {"1": cli_new, "2": cli_resume}
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
     banner()
-    print(color("Choose mode:", C.BRIGHT_WHITE, C.BOLD))
-    print(color("1) New generation", C.BRIGHT_GREEN))
-    print(color("2) Resume existing session", C.BRIGHT_GREEN))
-    mode = prompt("Enter choice [default: 1]", "1", show_default_hint=False)
-    if mode == "1":
-        cli_new()
-    elif mode == "2":
-        cli_resume()
+    # `--mode N` picks the menu entry up front, e.g. for batch runs
+    if len(argv) >= 2 and argv[0] == "--mode":
+        mode = argv[1]
     else:
+        print(color("Choose mode:", C.BRIGHT_WHITE, C.BOLD))
+        print(color("1) New generation", C.BRIGHT_GREEN))
+        print(color("2) Resume existing session", C.BRIGHT_GREEN))
+        mode = prompt("Enter choice [default: 1]", "1", show_default_hint=False)
+    handler = _MODES.get(mode)
+    if handler is None:
         print(color("Unknown choice.", C.BRIGHT_RED))
+        return
+    handler()
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
+        flush_sessions()
         print(color("\nAborted by user.", C.BRIGHT_YELLOW))